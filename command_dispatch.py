@@ -0,0 +1,230 @@
+"""
+Command Dispatch - Parsing and dispatch of keyword commands
+
+Shared by the Telegram bot and the CLI test harness. The module is fully
+type-annotated and avoids dynamic attribute tricks so it can optionally be
+compiled in place with mypyc (`mypyc command_dispatch.py`).
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import Commands, Messages
+from list_manager import ListManager
+
+# One pass over a message: optional leading @mention, the first word (command or
+# list name, bounded to keep work on junk input small) and the trimmed remainder
+_MESSAGE_RE = re.compile(r'\s*(@\S+\s+)?(\S{1,64})(?:\s+(.*\S))?\s*\Z', re.DOTALL)
+
+# Any whitespace other than a single space; collapsed so args match what users type
+_WHITESPACE_RUN = re.compile(r'\s{2,}|[^\S ]')
+
+# Shortest abbreviation accepted for a command; shorter prefixes fire on ordinary chat
+_MIN_PREFIX_LEN = 3
+
+# Destructive commands must be typed in full, so chat like "del shop" can't delete a list
+_NO_ABBREVIATION = frozenset({Commands.DELETE, Commands.REMOVE})
+
+# Prefixes that are everyday words and would answer ordinary messages ("list of stuff")
+_COMMON_WORDS = frozenset({'list', 'sea'})
+
+_STATS_TEMPLATE = """📊 **Bot Statistics:**
+• Total lists: {total_lists}
+• Total items: {total_items}
+• Average items per list: {average_items_per_list:.1f}
+• Largest list size: {largest_list_size}"""
+
+
+def _cmd_help(list_manager: ListManager, rest: str) -> str:
+    """Handle `help` - show available commands"""
+    return list_manager.get_help()
+
+
+def _cmd_create(list_manager: ListManager, rest: str) -> str:
+    """Handle `create <list_name>`"""
+    if not rest:
+        return Messages.USAGE_CREATE
+    return list_manager.create_list(rest)
+
+
+def _cmd_lists(list_manager: ListManager, rest: str) -> str:
+    """Handle `lists` - show all lists"""
+    return list_manager.show_all_lists()
+
+
+def _cmd_add(list_manager: ListManager, rest: str) -> str:
+    """Handle `add <list_name> <item>`"""
+    list_name, _, item = rest.partition(' ')
+    if not item:
+        return Messages.USAGE_ADD
+    return list_manager.add_item(list_name, item)
+
+
+def _cmd_remove(list_manager: ListManager, rest: str) -> str:
+    """Handle `remove <list_name> <item>`"""
+    list_name, _, item = rest.partition(' ')
+    if not item:
+        return Messages.USAGE_REMOVE
+    return list_manager.remove_item(list_name, item)
+
+
+def _cmd_show(list_manager: ListManager, rest: str) -> str:
+    """Handle `show <list_name>`"""
+    if not rest:
+        return Messages.USAGE_SHOW
+    return list_manager.show_list(rest)
+
+
+def _cmd_delete(list_manager: ListManager, rest: str) -> str:
+    """Handle `delete <list_name>`"""
+    if not rest:
+        return Messages.USAGE_DELETE
+    return list_manager.delete_list(rest)
+
+
+def _cmd_search(list_manager: ListManager, rest: str) -> str:
+    """Handle `search <term>`"""
+    if not rest:
+        return Messages.USAGE_SEARCH
+    return list_manager.search_item(rest)
+
+
+def _cmd_stats(list_manager: ListManager, rest: str) -> str:
+    """Handle `stats` - hidden command for debugging"""
+    return _STATS_TEMPLATE.format_map(list_manager.get_stats())
+
+
+# Handlers in dispatch order, paired with the command word that selects them
+_COMMANDS: Tuple[Tuple[str, Callable[[ListManager, str], str]], ...] = (
+    (Commands.HELP, _cmd_help),
+    (Commands.CREATE, _cmd_create),
+    (Commands.LISTS, _cmd_lists),
+    (Commands.ADD, _cmd_add),
+    (Commands.REMOVE, _cmd_remove),
+    (Commands.SHOW, _cmd_show),
+    (Commands.DELETE, _cmd_delete),
+    (Commands.SEARCH, _cmd_search),
+    ('stats', _cmd_stats),  # Hidden command for debugging
+)
+
+
+def _build_command_ids() -> Dict[str, int]:
+    """
+    Map each command word, and each unambiguous abbreviation of a public,
+    non-destructive command, to its handler index.
+    
+    Exact words always win over abbreviations; prefixes shared by two commands are dropped.
+    """
+    command_ids = {name: index for index, (name, _) in enumerate(_COMMANDS)}
+    
+    owners: Dict[str, Optional[int]] = {}
+    for index, (name, _) in enumerate(_COMMANDS):
+        if name not in Commands.ALL_COMMANDS or name in _NO_ABBREVIATION:
+            continue  # Hidden and destructive commands must be typed in full
+        for end in range(_MIN_PREFIX_LEN, len(name)):
+            prefix = name[:end]
+            owners[prefix] = None if prefix in owners else index
+    
+    for prefix, index in owners.items():
+        if index is not None and prefix not in command_ids and prefix not in _COMMON_WORDS:
+            command_ids[prefix] = index
+    
+    return command_ids
+
+
+_COMMAND_IDS: Dict[str, int] = _build_command_ids()
+_HANDLERS: Tuple[Callable[[ListManager, str], str], ...] = tuple(handler for _, handler in _COMMANDS)
+# Known command words mapped to the table's own key objects, so a parsed command
+# compares by identity at dispatch; other words pass through untouched
+_CANONICAL: Dict[str, str] = {name: name for name in _COMMAND_IDS}
+
+
+@lru_cache(maxsize=1024)
+def parse(message_text: str) -> Tuple[Optional[str], str]:
+    """
+    Parse a message into the lowercased command word and the rest of the text.
+    
+    Cached because group chats repeat the same short commands (`lists`, `help`, ...).
+    
+    Returns:
+        tuple: (command, rest) or (None, '') if the message is not a command
+    """
+    match = _MESSAGE_RE.match(message_text)
+    if not match or match.group(1):
+        return None, ''
+    
+    command, rest = match.group(2, 3)
+    if rest is None:
+        rest = ''
+    elif _WHITESPACE_RUN.search(rest):
+        rest = _WHITESPACE_RUN.sub(' ', rest)
+    
+    # Users nearly always type commands in lowercase; skip the copy in that case
+    if not command.islower():
+        command = command.lower()
+    command = _CANONICAL.get(command, command)
+    
+    return command, rest
+
+
+def parse_mention(message_text: str, mention_prefix: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse a mention to extract list name and items.
+    
+    Expected format: @bot_username <list_name> <item1>, <item2>, <item3>
+    
+    Returns:
+        tuple: (list_name, items_text) or (None, None) if invalid
+    """
+    match = _MESSAGE_RE.match(message_text)
+    if not match or not match.group(1) or match.group(1).rstrip() != mention_prefix:
+        return None, None
+    
+    list_name, items_text = match.group(2, 3)
+    if not items_text:
+        return None, None
+    
+    return list_name, items_text
+
+
+def split_items(items_text: str, max_items: int) -> Optional[List[str]]:
+    """
+    Split comma-separated items, `max_items` splits at a time, so input stuffed
+    with commas is rejected without splitting all of it.
+    
+    Returns:
+        The stripped, non-empty items, or None if there are more than `max_items`
+    """
+    items: List[str] = []
+    remainder = items_text
+    while True:
+        # Empty pieces don't count towards the cap, so the tail may need another pass
+        pieces = remainder.split(',', max_items)
+        more = len(pieces) > max_items
+        if more:
+            remainder = pieces.pop()
+        items.extend(item for item in map(str.strip, pieces) if item)
+        
+        if len(items) > max_items:
+            return None
+        if not more:
+            return items
+
+
+def is_command(command: str) -> bool:
+    """Check whether a parsed command word is a known command"""
+    return command in _COMMAND_IDS
+
+
+def dispatch(list_manager: ListManager, command: str, rest: str) -> Optional[str]:
+    """
+    Run a parsed command against the list manager.
+    
+    Returns:
+        The reply text, or None if the command is unknown
+    """
+    command_id = _COMMAND_IDS.get(command)
+    if command_id is None:
+        return None
+    return _HANDLERS[command_id](list_manager, rest)
@@ -24,6 +24,10 @@ class TelegramConfig:
     """Telegram bot configuration"""
     token: Optional[str] = None
     authorized_chat_id: Optional[int] = None
+    polling_timeout: int = 25  # Long-poll wait for getUpdates, in seconds (Telegram allows up to 50)
+    webhook_url: Optional[str] = None  # Public HTTPS base URL; enables webhook mode when set
+    webhook_port: int = 8443
+    webhook_secret: Optional[str] = None
     
     def __post_init__(self):
         if not self.token:
@@ -36,6 +40,19 @@ class TelegramConfig:
                     self.authorized_chat_id = int(chat_id)
                 except ValueError:
                     pass
+        
+        if not self.webhook_url:
+            self.webhook_url = os.getenv('WEBHOOK_URL')
+        
+        port = os.getenv('WEBHOOK_PORT')
+        if port:
+            try:
+                self.webhook_port = int(port)
+            except ValueError:
+                pass
+        
+        if not self.webhook_secret:
+            self.webhook_secret = os.getenv('WEBHOOK_SECRET')
 
 
 # Command constants
@@ -57,24 +74,24 @@ class Commands:
 
 # Response messages
 class Messages:
-    """Response message templates"""
-    LIST_CREATED = "✅ Created list '{name}'"
-    LIST_EXISTS = "❌ List '{name}' already exists!"
-    LIST_NOT_FOUND = "❌ List '{name}' not found!"
-    ITEM_ADDED = "✅ Added '{item}' to '{list_name}'"
-    ITEM_EXISTS = "⚠️ '{item}' is already in '{list_name}'"
-    ITEM_REMOVED = "✅ Removed '{item}' from '{list_name}'"
-    ITEM_NOT_FOUND = "❌ '{item}' not found in '{list_name}'"
-    LIST_DELETED = "🗑️ Deleted list '{name}'"
+    """Response message templates (%-style, filled positionally)"""
+    LIST_CREATED = "✅ Created list '%s'"
+    LIST_EXISTS = "❌ List '%s' already exists!"
+    LIST_NOT_FOUND = "❌ List '%s' not found!"
+    ITEM_ADDED = "✅ Added '%s' to '%s'"
+    ITEM_EXISTS = "⚠️ '%s' is already in '%s'"
+    ITEM_REMOVED = "✅ Removed '%s' from '%s'"
+    ITEM_NOT_FOUND = "❌ '%s' not found in '%s'"
+    LIST_DELETED = "🗑️ Deleted list '%s'"
     NO_LISTS = "📝 No lists created yet! Use 'create <list_name>' to create one."
-    EMPTY_LIST = "📝 List '{name}' is empty"
-    NO_SEARCH_RESULTS = "❌ No items found containing '{term}'"
+    EMPTY_LIST = "📝 List '%s' is empty"
+    NO_SEARCH_RESULTS = "❌ No items found containing '%s'"
     
     # Error messages
-    INVALID_LIST_NAME = "❌ List name must be 1-{max_len} characters long"
-    INVALID_ITEM = "❌ Item must be 1-{max_len} characters long"
-    TOO_MANY_LISTS = "❌ Maximum {max_lists} lists allowed"
-    TOO_MANY_ITEMS = "❌ Maximum {max_items} items per list allowed"
+    INVALID_LIST_NAME = "❌ List name must be 1-%s characters long"
+    INVALID_ITEM = "❌ Item must be 1-%s characters long"
+    TOO_MANY_LISTS = "❌ Maximum %s lists allowed"
+    TOO_MANY_ITEMS = "❌ Maximum %s items per list allowed"
     
     # Usage messages
     USAGE_CREATE = "❌ Usage: `create <list_name>`"
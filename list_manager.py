@@ -2,13 +2,20 @@
 List Manager - Core functionality for managing multiple lists
 """
 
+import hashlib
 import json
 import logging
 import os
+import re
 import shutil
-from datetime import datetime
-import pytz
-from typing import Dict, List, Optional
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
 
 from config import BotConfig, Messages
 from exceptions import (
@@ -23,6 +30,38 @@ from exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Splits comma-separated items and trims the whitespace around each comma
+_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Parsed data files shared across instances: path -> ((mtime_ns, size), data).
+# Cached data is never mutated; instances build their own structures from it.
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, List[str]]]] = {}
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _fold(text: str) -> str:
+    """Normalize text for case-insensitive comparison."""
+    return text.strip().casefold()
+
+
+def _file_signature(path: str) -> Tuple[int, int]:
+    """Return a cheap fingerprint of a file's current on-disk state."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
 
 class ListManager:
     """
@@ -41,62 +80,167 @@ class ListManager:
         """
         self.config = config or BotConfig()
         self.data_file = self.config.data_file
-        self.lists: Dict[str, List[str]] = {}
+        # Items are kept as insertion-ordered dict keys for O(1) membership
+        self.lists: Dict[str, Dict[str, None]] = {}
+        self._folded_names: Dict[str, str] = {}
+        # Per list, item -> folded item, in the same order as self.lists
+        self._folded_items: Dict[str, Dict[str, str]] = {}
+        # Running totals for get_stats; None means the largest size must be recomputed
+        self._total_items = 0
+        self._largest_list_size: Optional[int] = 0
+        self._dirty = False
+        # Nesting depth of `with` blocks; saving is deferred while above zero
+        self._batch_depth = 0
+        self._last_backup_ts = 0.0
+        self._last_saved_hash: Optional[bytes] = None
+        self._help_cache: Optional[str] = None
         self._load_data()
-        
-        # Set up logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+    
+    def __enter__(self) -> "ListManager":
+        """Defer saving until the outermost block exits so a burst of ops writes once."""
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Write any pending changes when leaving the outermost block."""
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
     
     def _load_data(self) -> None:
         """Load lists from JSON file with error handling."""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Validate loaded data
+                path = os.path.abspath(self.data_file)
+                signature = _file_signature(path)
+                cached = _FILE_CACHE.get(path)
+                if cached and cached[0] == signature:
+                    data = cached[1]
+                else:
+                    with open(self.data_file, 'rb') as f:
+                        data = _loads(f.read())
                     if isinstance(data, dict):
-                        self.lists = data
-                    else:
-                        logger.warning(f"Invalid data format in {self.data_file}")
-                        self.lists = {}
+                        _FILE_CACHE[path] = (signature, data)
+                
+                # Validate loaded data
+                if isinstance(data, dict):
+                    self.lists = self._lists_from_data(data)
+                else:
+                    logger.warning("Invalid data format in %s", self.data_file)
+                    self.lists = {}
             else:
                 self.lists = {}
-                logger.info(f"Data file {self.data_file} not found, starting fresh")
+                logger.info("Data file %s not found, starting fresh", self.data_file)
         except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             self._backup_corrupted_file()
             self.lists = {}
+        
+        # First name wins when two stored names fold the same (e.g. 'Straße'
+        # and 'STRASSE' were distinct under lower()); the other stays reachable
+        # by its exact name
+        self._folded_names = {}
+        for name in self.lists:
+            kept = self._folded_names.setdefault(_fold(name), name)
+            if kept != name:
+                logger.warning("List '%s' collides with '%s' when matched case-insensitively", name, kept)
+        self._folded_items = {
+            name: {item: _fold(item) for item in items}
+            for name, items in self.lists.items()
+        }
+        self._total_items = sum(len(items) for items in self.lists.values())
+        self._largest_list_size = None
+    
+    def _lists_from_data(self, data: Dict[str, Any]) -> Dict[str, Dict[str, None]]:
+        """Build the in-memory lists, skipping entries that are not lists of strings."""
+        lists = {}
+        bad_names = []
+        for name, items in data.items():
+            if isinstance(items, list) and all(isinstance(item, str) for item in items):
+                lists[name] = dict.fromkeys(items)
+            else:
+                bad_names.append(name)
+        
+        if bad_names:
+            logger.error("Skipping invalid lists in %s: %s", self.data_file, bad_names)
+            self._backup_corrupted_file()
+        
+        return lists
     
     def _backup_corrupted_file(self) -> None:
         """Create a backup of corrupted data file."""
         if os.path.exists(self.data_file):
-            backup_name = f"{self.data_file}.backup_{datetime.now(pytz.UTC).strftime('%Y%m%d_%H%M%S')}"
+            backup_name = f"{self.data_file}.backup_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
             try:
                 shutil.copy2(self.data_file, backup_name)
-                logger.info(f"Corrupted file backed up to {backup_name}")
+                logger.info("Corrupted file backed up to %s", backup_name)
             except IOError as e:
-                logger.error(f"Failed to backup corrupted file: {e}")
+                logger.error("Failed to backup corrupted file: %s", e)
     
     def _save_data(self) -> None:
-        """Save lists to JSON file with error handling."""
+        """Save lists to JSON file with error handling. No-op without pending changes."""
+        if not self._dirty:
+            return
+        
         try:
-            # Create backup if enabled
-            if self.config.backup_enabled and os.path.exists(self.data_file):
-                backup_name = f"{self.data_file}.backup"
-                shutil.copy2(self.data_file, backup_name)
+            data = {name: list(items) for name, items in self.lists.items()}
+            payload = _dumps(data)
+            
+            # Nothing changed since the last write, skip the I/O entirely
+            digest = hashlib.blake2b(payload, digest_size=8).digest()
+            if digest == self._last_saved_hash and os.path.exists(self.data_file):
+                self._dirty = False
+                return
             
-            # Save data
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.lists, f, ensure_ascii=False, indent=2)
+            self._maybe_backup()
             
-            logger.debug(f"Data saved to {self.data_file}")
+            # Write to a temp file and swap it in so a crash never leaves a partial file;
+            # fsync first so the rename can't reach disk ahead of the data
+            tmp_file = f"{self.data_file}.tmp"
+            try:
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.data_file)
+            except IOError:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+                raise
+            self._last_saved_hash = digest
+            
+            path = os.path.abspath(self.data_file)
+            _FILE_CACHE[path] = (_file_signature(path), data)
+            
+            self._dirty = False
+            logger.debug("Data saved to %s", self.data_file)
         except IOError as e:
-            logger.error(f"Error saving data: {e}")
+            logger.error("Error saving data: %s", e)
             raise DataStorageError(f"Failed to save data: {e}")
     
+    def _maybe_backup(self) -> None:
+        """Copy the current data file aside at most once per backup interval."""
+        if not self.config.backup_enabled or not os.path.exists(self.data_file):
+            return
+        
+        now = time.time()
+        if now - self._last_backup_ts < self.config.backup_interval_hours * 3600:
+            return
+        
+        backup_name = f"{self.data_file}.backup"
+        shutil.copy2(self.data_file, backup_name)
+        self._last_backup_ts = now
+    
+    def _mark_dirty(self) -> None:
+        """Record a mutation and save it now unless saving is deferred."""
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_data()
+    
+    def flush(self) -> None:
+        """Save pending changes, if any."""
+        self._save_data()
+    
     def _validate_list_name(self, list_name: str) -> None:
         """Validate list name format and length."""
         if not list_name or not list_name.strip():
@@ -105,7 +249,7 @@ class ListManager:
         list_name = list_name.strip()
         if len(list_name) > self.config.max_list_name_length:
             raise ValidationError(
-                Messages.INVALID_LIST_NAME.format(max_len=self.config.max_list_name_length)
+                Messages.INVALID_LIST_NAME % self.config.max_list_name_length
             )
     
     def _validate_item(self, item: str) -> None:
@@ -116,29 +260,33 @@ class ListManager:
         item = item.strip()
         if len(item) > self.config.max_item_length:
             raise ValidationError(
-                Messages.INVALID_ITEM.format(max_len=self.config.max_item_length)
+                Messages.INVALID_ITEM % self.config.max_item_length
             )
     
     def _find_list_name(self, list_name: str) -> Optional[str]:
-        """Find the actual list name (case-insensitive)."""
-        list_name_lower = list_name.lower()
-        for name in self.lists.keys():
-            if name.lower() == list_name_lower:
-                return name
-        return None
+        """Find the actual list name (case-insensitive, exact name first)."""
+        if list_name in self.lists:
+            return list_name
+        return self._folded_names.get(_fold(list_name))
+    
+    def _count_added(self, items: Dict[str, None], count: int) -> None:
+        """Update the running stats after adding items to a list."""
+        self._total_items += count
+        if self._largest_list_size is not None:
+            self._largest_list_size = max(self._largest_list_size, len(items))
     
     def _check_list_limit(self) -> None:
         """Check if creating a new list would exceed the limit."""
         if len(self.lists) >= self.config.max_lists_per_user:
             raise LimitExceededError(
-                Messages.TOO_MANY_LISTS.format(max_lists=self.config.max_lists_per_user)
+                Messages.TOO_MANY_LISTS % self.config.max_lists_per_user
             )
     
-    def _check_item_limit(self, list_name: str) -> None:
-        """Check if adding an item would exceed the limit."""
-        if len(self.lists[list_name]) >= self.config.max_items_per_list:
+    def _check_item_limit(self, items: Dict[str, None]) -> None:
+        """Check if adding an item to the given list would exceed the limit."""
+        if len(items) >= self.config.max_items_per_list:
             raise LimitExceededError(
-                Messages.TOO_MANY_ITEMS.format(max_items=self.config.max_items_per_list)
+                Messages.TOO_MANY_ITEMS % self.config.max_items_per_list
             )
     
     def create_list(self, list_name: str) -> str:
@@ -163,19 +311,21 @@ class ListManager:
             list_name = list_name.strip()
             
             if self._find_list_name(list_name):
-                raise ListExistsError(Messages.LIST_EXISTS.format(name=list_name))
+                raise ListExistsError(Messages.LIST_EXISTS % list_name)
             
-            self.lists[list_name] = []
-            self._save_data()
+            self.lists[list_name] = {}
+            self._folded_names[_fold(list_name)] = list_name
+            self._folded_items[list_name] = {}
+            self._mark_dirty()
             
-            logger.info(f"Created list: {list_name}")
-            return Messages.LIST_CREATED.format(name=list_name)
+            logger.info("Created list: %s", list_name)
+            return Messages.LIST_CREATED % list_name
             
         except (ValidationError, ListExistsError, LimitExceededError) as e:
-            logger.warning(f"Failed to create list '{list_name}': {e}")
+            logger.warning("Failed to create list '%s': %s", list_name, e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error creating list '{list_name}': {e}")
+        except DataStorageError as e:
+            logger.error("Storage error creating list '%s': %s", list_name, e)
             return f"❌ An error occurred while creating the list"
     
     def add_item(self, list_name: str, item: str) -> str:
@@ -194,35 +344,38 @@ class ListManager:
             
             actual_list_name = self._find_list_name(list_name)
             if not actual_list_name:
-                raise ListNotFoundError(Messages.LIST_NOT_FOUND.format(name=list_name))
+                raise ListNotFoundError(Messages.LIST_NOT_FOUND % list_name)
             
-            self._check_item_limit(actual_list_name)
+            items = self.lists[actual_list_name]
+            self._check_item_limit(items)
             
             item = item.strip()
             
-            if item in self.lists[actual_list_name]:
-                raise ItemExistsError(Messages.ITEM_EXISTS.format(item=item, list_name=actual_list_name))
+            if item in items:
+                raise ItemExistsError(Messages.ITEM_EXISTS % (item, actual_list_name))
             
-            self.lists[actual_list_name].append(item)
-            self._save_data()
+            items[item] = None
+            self._folded_items[actual_list_name][item] = _fold(item)
+            self._count_added(items, 1)
+            self._mark_dirty()
             
-            logger.info(f"Added '{item}' to '{actual_list_name}'")
-            return Messages.ITEM_ADDED.format(item=item, list_name=actual_list_name)
+            logger.info("Added '%s' to '%s'", item, actual_list_name)
+            return Messages.ITEM_ADDED % (item, actual_list_name)
             
         except (ValidationError, ListNotFoundError, ItemExistsError, LimitExceededError) as e:
-            logger.warning(f"Failed to add item '{item}' to '{list_name}': {e}")
+            logger.warning("Failed to add item '%s' to '%s': %s", item, list_name, e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error adding item '{item}' to '{list_name}': {e}")
+        except DataStorageError as e:
+            logger.error("Storage error adding item '%s' to '%s': %s", item, list_name, e)
             return f"❌ An error occurred while adding the item"
     
-    def add_multiple_items(self, list_name: str, items_text: str) -> str:
+    def add_multiple_items(self, list_name: str, items_text: Union[str, Sequence[str]]) -> str:
         """
         Add multiple items to a list, separated by commas.
         
         Args:
             list_name: Name of the list
-            items_text: Comma-separated items to add
+            items_text: Comma-separated items to add, or the items already split
             
         Returns:
             Success or error message with summary
@@ -230,61 +383,61 @@ class ListManager:
         try:
             actual_list_name = self._find_list_name(list_name)
             if not actual_list_name:
-                raise ListNotFoundError(Messages.LIST_NOT_FOUND.format(name=list_name))
+                raise ListNotFoundError(Messages.LIST_NOT_FOUND % list_name)
             
-            # Split by comma and clean up items
-            items = [item.strip() for item in items_text.split(',') if item.strip()]
+            # Split by comma unless the caller already did, then clean up items
+            if isinstance(items_text, str):
+                items = [item for item in _SPLIT_RE.split(items_text.strip()) if item]
+            else:
+                items = [item.strip() for item in items_text if item and not item.isspace()]
             
             if not items:
                 raise ValidationError("No valid items found")
             
+            existing = self.lists[actual_list_name]
+            
             # Check if we'd exceed the limit
-            if len(self.lists[actual_list_name]) + len(items) > self.config.max_items_per_list:
+            if len(existing) + len(items) > self.config.max_items_per_list:
                 raise LimitExceededError(
                     f"❌ Adding {len(items)} items would exceed the limit of {self.config.max_items_per_list} items per list"
                 )
             
-            added_items = []
-            skipped_items = []
-            failed_items = []
-            
-            for item in items:
-                try:
-                    self._validate_item(item)
-                    
-                    if item in self.lists[actual_list_name]:
-                        skipped_items.append(item)
-                    else:
-                        self.lists[actual_list_name].append(item)
-                        added_items.append(item)
-                        
-                except ValidationError as e:
-                    failed_items.append(f"{item} (invalid)")
-                except Exception as e:
-                    failed_items.append(f"{item} (error)")
+            # Split items are already stripped and non-empty, so validation
+            # reduces to the length check
+            max_len = self.config.max_item_length
+            valid_items = [item for item in items if len(item) <= max_len]
+            failed_items = [f"{item} (invalid)" for item in items if len(item) > max_len]
+            
+            # Repeats within the batch collapse to one entry, then split
+            # against what the list already holds
+            unique_items = dict.fromkeys(valid_items)
+            added_items = [item for item in unique_items if item not in existing]
+            skipped_items = [item for item in unique_items if item in existing]
+            
+            existing.update(dict.fromkeys(added_items))
+            self._folded_items[actual_list_name].update(
+                (item, _fold(item)) for item in added_items
+            )
+            self._count_added(existing, len(added_items))
             
             # Save data if we added anything
             if added_items:
-                self._save_data()
-                logger.info(f"Added {len(added_items)} items to '{actual_list_name}': {added_items}")
+                self._mark_dirty()
+                logger.info(
+                    "Added %s items to '%s': %s", len(added_items), actual_list_name, added_items
+                )
             
             # Build response message
             result_parts = []
-            
-            if added_items:
-                result_parts.append(f"✅ Added {len(added_items)} items to '{actual_list_name}':")
-                for item in added_items:
-                    result_parts.append(f"  • {item}")
-            
-            if skipped_items:
-                result_parts.append(f"⚠️ Skipped {len(skipped_items)} duplicate items:")
-                for item in skipped_items:
-                    result_parts.append(f"  • {item}")
-            
-            if failed_items:
-                result_parts.append(f"❌ Failed to add {len(failed_items)} items:")
-                for item in failed_items:
-                    result_parts.append(f"  • {item}")
+            sections = (
+                (added_items, f"✅ Added {len(added_items)} items to '{actual_list_name}':"),
+                (skipped_items, f"⚠️ Skipped {len(skipped_items)} duplicate items:"),
+                (failed_items, f"❌ Failed to add {len(failed_items)} items:"),
+            )
+            for section_items, heading in sections:
+                if section_items:
+                    result_parts.append(heading)
+                    result_parts.extend(f"  • {item}" for item in section_items)
             
             if not result_parts:
                 return "❌ No items were processed"
@@ -292,10 +445,10 @@ class ListManager:
             return "\n".join(result_parts)
             
         except (ValidationError, ListNotFoundError, LimitExceededError) as e:
-            logger.warning(f"Failed to add multiple items to '{list_name}': {e}")
+            logger.warning("Failed to add multiple items to '%s': %s", list_name, e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error adding multiple items to '{list_name}': {e}")
+        except DataStorageError as e:
+            logger.error("Storage error adding multiple items to '%s': %s", list_name, e)
             return f"❌ An error occurred while adding the items"
     
     def remove_item(self, list_name: str, item: str) -> str:
@@ -312,24 +465,27 @@ class ListManager:
         try:
             actual_list_name = self._find_list_name(list_name)
             if not actual_list_name:
-                raise ListNotFoundError(Messages.LIST_NOT_FOUND.format(name=list_name))
+                raise ListNotFoundError(Messages.LIST_NOT_FOUND % list_name)
             
             item = item.strip()
             
-            if item not in self.lists[actual_list_name]:
-                raise ItemNotFoundError(Messages.ITEM_NOT_FOUND.format(item=item, list_name=actual_list_name))
-            
-            self.lists[actual_list_name].remove(item)
-            self._save_data()
+            try:
+                del self.lists[actual_list_name][item]
+            except KeyError:
+                raise ItemNotFoundError(Messages.ITEM_NOT_FOUND % (item, actual_list_name))
+            del self._folded_items[actual_list_name][item]
+            self._total_items -= 1
+            self._largest_list_size = None
+            self._mark_dirty()
             
-            logger.info(f"Removed '{item}' from '{actual_list_name}'")
-            return Messages.ITEM_REMOVED.format(item=item, list_name=actual_list_name)
+            logger.info("Removed '%s' from '%s'", item, actual_list_name)
+            return Messages.ITEM_REMOVED % (item, actual_list_name)
             
         except (ListNotFoundError, ItemNotFoundError) as e:
-            logger.warning(f"Failed to remove item '{item}' from '{list_name}': {e}")
+            logger.warning("Failed to remove item '%s' from '%s': %s", item, list_name, e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error removing item '{item}' from '{list_name}': {e}")
+        except DataStorageError as e:
+            logger.error("Storage error removing item '%s' from '%s': %s", item, list_name, e)
             return f"❌ An error occurred while removing the item"
     
     def show_list(self, list_name: str) -> str:
@@ -345,24 +501,19 @@ class ListManager:
         try:
             actual_list_name = self._find_list_name(list_name)
             if not actual_list_name:
-                raise ListNotFoundError(Messages.LIST_NOT_FOUND.format(name=list_name))
+                raise ListNotFoundError(Messages.LIST_NOT_FOUND % list_name)
             
             items = self.lists[actual_list_name]
             if not items:
-                return Messages.EMPTY_LIST.format(name=actual_list_name)
-            
-            result = f"📋 **{actual_list_name}** ({len(items)} items):\n"
-            for i, item in enumerate(items, 1):
-                result += f"{i}. {item}\n"
+                return Messages.EMPTY_LIST % actual_list_name
             
-            return result.strip()
+            lines = [f"📋 **{actual_list_name}** ({len(items)} items):"]
+            lines.extend(f"{i}. {item}" for i, item in enumerate(items, 1))
+            return "\n".join(lines)
             
         except ListNotFoundError as e:
-            logger.warning(f"Failed to show list '{list_name}': {e}")
+            logger.warning("Failed to show list '%s': %s", list_name, e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error showing list '{list_name}': {e}")
-            return f"❌ An error occurred while showing the list"
     
     def show_all_lists(self) -> str:
         """
@@ -374,13 +525,13 @@ class ListManager:
         if not self.lists:
             return Messages.NO_LISTS
         
-        result = "📚 **All Lists:**\n"
+        lines = ["📚 **All Lists:**"]
         # Sort lists by name for consistent display
-        sorted_lists = sorted(self.lists.items())
-        for list_name, items in sorted_lists:
-            result += f"• {list_name} ({len(items)} items)\n"
-        
-        return result.strip()
+        lines.extend(
+            f"• {list_name} ({len(self.lists[list_name])} items)"
+            for list_name in sorted(self.lists)
+        )
+        return "\n".join(lines)
     
     def delete_list(self, list_name: str) -> str:
         """
@@ -395,21 +546,38 @@ class ListManager:
         try:
             actual_list_name = self._find_list_name(list_name)
             if not actual_list_name:
-                raise ListNotFoundError(Messages.LIST_NOT_FOUND.format(name=list_name))
-            
-            del self.lists[actual_list_name]
-            self._save_data()
-            
-            logger.info(f"Deleted list: {actual_list_name}")
-            return Messages.LIST_DELETED.format(name=actual_list_name)
+                raise ListNotFoundError(Messages.LIST_NOT_FOUND % list_name)
+            
+            self._total_items -= len(self.lists.pop(actual_list_name))
+            self._largest_list_size = None
+            folded = _fold(actual_list_name)
+            if self._folded_names.get(folded) == actual_list_name:
+                # Hand the key to a colliding list, if one was loaded from disk
+                replacement = next((name for name in self.lists if _fold(name) == folded), None)
+                if replacement is None:
+                    del self._folded_names[folded]
+                else:
+                    self._folded_names[folded] = replacement
+            del self._folded_items[actual_list_name]
+            self._mark_dirty()
+            
+            logger.info("Deleted list: %s", actual_list_name)
+            return Messages.LIST_DELETED % actual_list_name
             
         except ListNotFoundError as e:
-            logger.warning(f"Failed to delete list '{list_name}': {e}")
+            logger.warning("Failed to delete list '%s': %s", list_name, e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error deleting list '{list_name}': {e}")
+        except DataStorageError as e:
+            logger.error("Storage error deleting list '%s': %s", list_name, e)
             return f"❌ An error occurred while deleting the list"
     
+    def _iter_matches(self, folded_term: str) -> Iterator[str]:
+        """Yield a display line for every item containing the folded term."""
+        for list_name, items in self._folded_items.items():
+            for item, folded_item in items.items():
+                if folded_term in folded_item:
+                    yield f"📋 {list_name}: {item}"
+    
     def search_item(self, search_term: str) -> str:
         """
         Search for an item across all lists.
@@ -425,27 +593,16 @@ class ListManager:
                 raise ValidationError("Search term cannot be empty")
             
             search_term = search_term.strip()
-            results = []
-            search_term_lower = search_term.lower()
-            
-            for list_name, items in self.lists.items():
-                for item in items:
-                    if search_term_lower in item.lower():
-                        results.append(f"📋 {list_name}: {item}")
+            results = "\n".join(self._iter_matches(_fold(search_term)))
             
             if not results:
-                return Messages.NO_SEARCH_RESULTS.format(term=search_term)
+                return Messages.NO_SEARCH_RESULTS % search_term
             
-            result = f"🔍 **Search results for '{search_term}':**\n"
-            result += "\n".join(results)
-            return result
+            return f"🔍 **Search results for '{search_term}':**\n{results}"
             
         except ValidationError as e:
-            logger.warning(f"Search validation error: {e}")
+            logger.warning("Search validation error: %s", e)
             return str(e)
-        except Exception as e:
-            logger.error(f"Unexpected error searching for '{search_term}': {e}")
-            return f"❌ An error occurred while searching"
     
     def get_stats(self) -> Dict[str, int]:
         """
@@ -454,17 +611,23 @@ class ListManager:
         Returns:
             Dictionary with statistics
         """
-        total_items = sum(len(items) for items in self.lists.values())
+        if self._largest_list_size is None:
+            self._largest_list_size = max((len(items) for items in self.lists.values()), default=0)
+        
+        total_items = self._total_items
         return {
             'total_lists': len(self.lists),
             'total_items': total_items,
             'average_items_per_list': total_items / len(self.lists) if self.lists else 0,
-            'largest_list_size': max(len(items) for items in self.lists.values()) if self.lists else 0,
+            'largest_list_size': self._largest_list_size,
         }
     
     def get_help(self) -> str:
-        """Get help text with available commands."""
-        return """🤖 **List Bot Commands:**
+        """Get help text with available commands (built once, config is fixed)."""
+        if self._help_cache is not None:
+            return self._help_cache
+        
+        self._help_cache = """🤖 **List Bot Commands:**
 
 **List Management:**
 • `create <list_name>` - Create a new list
@@ -490,6 +653,8 @@ class ListManager:
 • `show groceries`
 • `search milk`
 
+**Tip:** commands other than `delete` and `remove` can be shortened to their first 3+ letters, e.g. `sho groceries`
+
 **Limits:**
 • Max lists: {max_lists}
 • Max items per list: {max_items}
@@ -499,4 +664,5 @@ class ListManager:
             max_items=self.config.max_items_per_list,
             max_name_len=self.config.max_list_name_length,
             max_item_len=self.config.max_item_length
-        ) 
\ No newline at end of file
+        )
+        return self._help_cache 
\ No newline at end of file
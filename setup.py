@@ -14,6 +14,12 @@ TELEGRAM_BOT_TOKEN=your_bot_token_here
 
 # Optional: Restrict bot to specific chat (get this from your group chat)
 # AUTHORIZED_CHAT_ID=-1234567890
+
+# Optional: Receive updates via webhook instead of polling
+# (requires: pip install "python-telegram-bot[webhooks]")
+# WEBHOOK_URL=https://example.com
+# WEBHOOK_PORT=8443
+# WEBHOOK_SECRET=some_random_secret
 """
     
     env_file = Path('.env')
@@ -45,6 +51,7 @@ def main():
     
     print("\n🔧 Optional:")
     print("- Add AUTHORIZED_CHAT_ID to restrict bot to specific chat")
+    print("- Add WEBHOOK_URL to receive updates via webhook instead of polling")
     print("- Check config.py to adjust limits and settings")
 
 if __name__ == "__main__":
@@ -4,15 +4,24 @@ Telegram List Bot
 A bot that manages lists with keyword commands for private group chats
 """
 
+import asyncio
 import logging
-from typing import Optional
-from telegram import Update
+from typing import Optional, Set
+
+try:
+    import uvloop
+except ImportError:  # optional speedup (not available on Windows), fall back to asyncio's loop
+    uvloop = None
+
+from telegram import Message, Update
+from telegram.error import BadRequest, NetworkError
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
-from telegram.constants import ParseMode
+from telegram.constants import MessageEntityType, ParseMode
 from dotenv import load_dotenv
 
+import command_dispatch
 from list_manager import ListManager
-from config import BotConfig, TelegramConfig, Commands, Messages
+from config import BotConfig, Messages, TelegramConfig
 
 # Load environment variables
 load_dotenv()
@@ -24,6 +33,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_WELCOME_MESSAGE = """🤖 **List Bot is ready!**
+
+I'll help you manage lists in this group chat using simple keyword commands.
+
+Type any of these commands to get started:
+• `help` - Show all available commands
+• `create groceries` - Create a new list
+• `lists` - Show all your lists
+
+I work with natural language - just type the commands without slashes!
+
+**Quick Example:**
+• `create shopping`
+• `add shopping milk`
+• `add shopping bread`
+• `show shopping`"""
+
+_INVALID_MENTION_TEMPLATE = """❌ Invalid mention format!
+
+**Quick Add Usage:**
+`@{bot_username} <list_name> <item1>, <item2>, <item3>`
+
+**Example:**
+`@{bot_username} groceries milk, bread, eggs`"""
+
 
 class TelegramListBot:
     """
@@ -43,233 +77,175 @@ class TelegramListBot:
         self.telegram_config = telegram_config
         self.bot_config = bot_config or BotConfig()
         self.list_manager = ListManager(self.bot_config)
+        # Plain attribute so the per-message authorization check is a single compare
+        self._authorized_chat_id = telegram_config.authorized_chat_id
+        self._seen_chat_ids: Set[int] = set()
+        
+        # Filled in by post_init once the bot's username is known
+        self._mention_prefix = ""
+        self._invalid_mention_help = ""
         
         logger.info("Telegram List Bot initialized")
         
+    async def post_init(self, application: Application) -> None:
+        """Cache the bot's mention prefix and mention help text once at startup"""
+        bot_username = application.bot.username
+        self._mention_prefix = f"@{bot_username}"
+        self._invalid_mention_help = _INVALID_MENTION_TEMPLATE.format(bot_username=bot_username)
+    
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Start command handler"""
-        welcome_message = """🤖 **List Bot is ready!**
-
-I'll help you manage lists in this group chat using simple keyword commands.
-
-Type any of these commands to get started:
-• `help` - Show all available commands
-• `create groceries` - Create a new list
-• `lists` - Show all your lists
-
-I work with natural language - just type the commands without slashes!
-
-**Quick Example:**
-• `create shopping`
-• `add shopping milk`
-• `add shopping bread`
-• `show shopping`"""
-        
-        await update.message.reply_text(welcome_message, parse_mode=ParseMode.MARKDOWN)
-        logger.info(f"Start command from user {update.effective_user.id} in chat {update.message.chat_id}")
+        message = update.message
+        logger.info("Start command from user %s in chat %s", update.effective_user.id, message.chat_id)
+        await message.reply_text(_WELCOME_MESSAGE, parse_mode=ParseMode.MARKDOWN)
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Help command handler"""
+        message = update.message
         help_text = self.list_manager.get_help()
-        await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
-        logger.info(f"Help command from user {update.effective_user.id} in chat {update.message.chat_id}")
-    
-    def _is_authorized_chat(self, chat_id: int) -> bool:
-        """Check if the chat is authorized to use the bot"""
-        if not self.telegram_config.authorized_chat_id:
-            return True  # No restriction
-        return chat_id == self.telegram_config.authorized_chat_id
+        logger.info("Help command from user %s in chat %s", update.effective_user.id, message.chat_id)
+        await message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
     
-    def _parse_command(self, message_text: str) -> tuple:
-        """Parse a message into command and arguments"""
-        parts = message_text.strip().split()
-        if not parts:
-            return None, []
-        
-        command = parts[0].lower()
-        args = parts[1:]
-        
-        return command, args
+    async def _send_reply(self, message: Message, text: str) -> None:
+        """Reply with Markdown, falling back to plain text if Telegram can't parse it"""
+        try:
+            await message.reply_text(text, parse_mode=ParseMode.MARKDOWN)
+        except BadRequest as e:
+            # List names and items may contain Markdown characters (`_`, `*`, ...)
+            logger.warning("Markdown reply rejected in chat %s, resending as plain text: %s", message.chat_id, e)
+            await message.reply_text(text)
+        except NetworkError as e:
+            logger.error("Failed to send reply in chat %s: %s", message.chat_id, e)
     
-    async def _handle_command(self, command: str, args: list) -> Optional[str]:
+    async def _handle_command(self, command: str, rest: str) -> Optional[str]:
         """Handle a specific command and return the response"""
-        if command == Commands.HELP:
-            return self.list_manager.get_help()
-        
-        elif command == Commands.CREATE:
-            if not args:
-                return Messages.USAGE_CREATE
-            list_name = ' '.join(args)
-            return self.list_manager.create_list(list_name)
-        
-        elif command == Commands.LISTS:
-            return self.list_manager.show_all_lists()
-        
-        elif command == Commands.ADD:
-            if len(args) < 2:
-                return Messages.USAGE_ADD
-            list_name = args[0]
-            item = ' '.join(args[1:])
-            return self.list_manager.add_item(list_name, item)
-        
-        elif command == Commands.REMOVE:
-            if len(args) < 2:
-                return Messages.USAGE_REMOVE
-            list_name = args[0]
-            item = ' '.join(args[1:])
-            return self.list_manager.remove_item(list_name, item)
-        
-        elif command == Commands.SHOW:
-            if not args:
-                return Messages.USAGE_SHOW
-            list_name = ' '.join(args)
-            return self.list_manager.show_list(list_name)
-        
-        elif command == Commands.DELETE:
-            if not args:
-                return Messages.USAGE_DELETE
-            list_name = ' '.join(args)
-            return self.list_manager.delete_list(list_name)
-        
-        elif command == Commands.SEARCH:
-            if not args:
-                return Messages.USAGE_SEARCH
-            search_term = ' '.join(args)
-            return self.list_manager.search_item(search_term)
-        
-        elif command == 'stats':
-            # Hidden command for debugging
-            stats = self.list_manager.get_stats()
-            return f"""📊 **Bot Statistics:**
-• Total lists: {stats['total_lists']}
-• Total items: {stats['total_items']}
-• Average items per list: {stats['average_items_per_list']:.1f}
-• Largest list size: {stats['largest_list_size']}"""
-        
-        return None  # Unknown command
-    
-    def _parse_mention(self, message_text: str, bot_username: str) -> tuple:
-        """
-        Parse a mention to extract list name and items.
-        
-        Expected format: @bot_username <list_name> <item1>, <item2>, <item3>
-        
-        Returns:
-            tuple: (list_name, items_text) or (None, None) if invalid
-        """
-        # Remove the @bot_username from the beginning
-        mention_prefix = f"@{bot_username}"
-        if not message_text.startswith(mention_prefix):
-            return None, None
-        
-        # Get the text after the mention
-        remaining_text = message_text[len(mention_prefix):].strip()
-        
-        if not remaining_text:
-            return None, None
-        
-        # Split into list name and items
-        parts = remaining_text.split(None, 1)  # Split on first whitespace
-        if len(parts) < 2:
-            return None, None
-        
-        list_name = parts[0]
-        items_text = parts[1]
-        
-        return list_name, items_text
+        return command_dispatch.dispatch(self.list_manager, command, rest)
     
     async def handle_mention(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle when the bot is mentioned for quick item adding"""
-        message_text = update.message.text.strip()
-        
-        # Get bot username
-        bot_username = context.bot.username
+        # Read the message attributes once up front
+        message = update.message
+        message_text = message.text
         
         # Parse the mention
-        list_name, items_text = self._parse_mention(message_text, bot_username)
+        list_name, items_text = command_dispatch.parse_mention(message_text, self._mention_prefix)
         
         if not list_name or not items_text:
             # Invalid mention format
-            help_text = f"""❌ Invalid mention format!
-
-**Quick Add Usage:**
-`@{bot_username} <list_name> <item1>, <item2>, <item3>`
-
-**Example:**
-`@{bot_username} groceries milk, bread, eggs`"""
-            
-            await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
+            await message.reply_text(self._invalid_mention_help, parse_mode=ParseMode.MARKDOWN)
             return
         
-        try:
-            # Use the new add_multiple_items method
-            response = self.list_manager.add_multiple_items(list_name, items_text)
-            await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
-            
-            logger.info(f"Processed mention from user {update.effective_user.id} in chat {update.message.chat_id}: {list_name} <- {items_text}")
-            
-        except Exception as e:
-            logger.error(f"Error processing mention '{message_text}': {e}")
-            await update.message.reply_text("❌ An error occurred while processing your mention.")
+        # Split here with a bounded number of splits so comma floods cost no extra work
+        max_items = self.bot_config.max_items_per_list
+        items = command_dispatch.split_items(items_text, max_items)
+        if items is None:
+            await message.reply_text(Messages.TOO_MANY_ITEMS % max_items)
+            return
+        
+        # ListManager reports its own failures as reply text
+        response = self.list_manager.add_multiple_items(list_name, items)
+        
+        # Log before the reply so the log write doesn't wait on the network round trip
+        logger.info(
+            "Processed mention from user %s in chat %s: %s <- %s",
+            update.effective_user.id, message.chat_id, list_name, items_text
+        )
+        
+        await self._send_reply(message, response)
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle all text messages - both mentions and regular commands"""
-        # Check authorization
-        if not self._is_authorized_chat(update.message.chat_id):
-            logger.warning(f"Unauthorized chat {update.message.chat_id} tried to use bot")
+        # Check authorization (no restriction when unset)
+        message = update.message
+        chat_id = message.chat_id
+        if self._authorized_chat_id and chat_id != self._authorized_chat_id:
+            logger.warning("Unauthorized chat %s tried to use bot", chat_id)
             return
         
-        # Log chat ID for easy identification
-        logger.info(f"📋 CHAT ID: {update.message.chat_id} (User: {update.effective_user.id})")
-        
-        message_text = update.message.text.strip()
+        message_text = message.text
         
         # Ignore empty messages
-        if not message_text:
+        if not message_text or message_text.isspace():
             return
         
+        user_id = update.effective_user.id
+        
+        # Log chat ID for easy identification; once at INFO, then only at DEBUG
+        if chat_id in self._seen_chat_ids:
+            logger.debug("📋 CHAT ID: %s (User: %s)", chat_id, user_id)
+        else:
+            self._seen_chat_ids.add(chat_id)
+            logger.info("📋 CHAT ID: %s (User: %s)", chat_id, user_id)
+        
         # Check if this is a mention
-        if update.message.entities and any(entity.type == "mention" for entity in update.message.entities):
-            await self.handle_mention(update, context)
-            return
+        entities = message.entities
+        if entities:
+            for entity in entities:
+                if entity.type == MessageEntityType.MENTION:
+                    await self.handle_mention(update, context)
+                    return
         
         # Parse the command
-        command, args = self._parse_command(message_text)
+        command, rest = command_dispatch.parse(message_text)
         
         if not command:
             return
         
-        try:
-            response = await self._handle_command(command, args)
-            
-            if response:
-                await update.message.reply_text(response, parse_mode=ParseMode.MARKDOWN)
-                logger.info(f"Processed command '{command}' from user {update.effective_user.id} in chat {update.message.chat_id}")
-            else:
-                # Unknown command - don't respond to avoid spam
-                logger.debug(f"Unknown command '{command}' from user {update.effective_user.id} in chat {update.message.chat_id}")
-                
-        except Exception as e:
-            logger.error(f"Error processing message '{message_text}': {e}")
-            await update.message.reply_text("❌ An error occurred while processing your request.")
+        if not command_dispatch.is_command(command):
+            # Unknown command - don't respond to avoid spam
+            logger.debug(
+                "Unknown command '%s' from user %s in chat %s",
+                command, user_id, chat_id
+            )
+            return
+        
+        response = await self._handle_command(command, rest)
+        if not response:
+            return
+        
+        logger.info(
+            "Processed command '%s' from user %s in chat %s",
+            command, user_id, chat_id
+        )
+        
+        await self._send_reply(message, response)
+    
+    async def error_handler(self, update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Log errors raised by handlers and let the user know their request failed"""
+        logger.error("Error while handling an update: %s", context.error, exc_info=context.error)
+        
+        if isinstance(update, Update) and update.effective_message:
+            await update.effective_message.reply_text(
+                "❌ An error occurred while processing your request.", disable_notification=True
+            )
 
 
 def create_application(telegram_config: TelegramConfig, bot_config: Optional[BotConfig] = None) -> Application:
     """Create and configure the Telegram application"""
     bot = TelegramListBot(telegram_config, bot_config)
     
-    application = Application.builder().token(telegram_config.token).build()
+    application = (
+        Application.builder()
+        .token(telegram_config.token)
+        .post_init(bot.post_init)
+        .build()
+    )
     
     # Add handlers in order of priority
     application.add_handler(CommandHandler("start", bot.start))
     application.add_handler(CommandHandler("help", bot.help_command))
     
-    # Handle ALL text messages (simplified - no filters except commands)
+    # Handle ALL text messages (simplified - no filters except commands).
+    # Non-blocking so a slow reply doesn't hold up the next update; list
+    # operations never await, so they still run one at a time.
     application.add_handler(MessageHandler(
         filters.TEXT & ~filters.COMMAND, 
-        bot.handle_message
+        bot.handle_message,
+        block=False
     ))
     
+    application.add_error_handler(bot.error_handler)
+    
     return application
 
 
@@ -287,6 +263,10 @@ def main():
         print("\nOptional: Add AUTHORIZED_CHAT_ID to restrict bot to specific chat")
         return
     
+    # Must be set before the application creates its event loop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         # Create and run application
         application = create_application(telegram_config, bot_config)
@@ -299,10 +279,21 @@ def main():
             print("🌐 Open to all chats")
         print("Press Ctrl+C to stop the bot")
         
-        application.run_polling()
+        if telegram_config.webhook_url:
+            # Telegram pushes updates to us; the token in the path keeps the endpoint unguessable
+            print(f"🪝 Listening for webhook updates on port {telegram_config.webhook_port}")
+            application.run_webhook(
+                listen="0.0.0.0",
+                port=telegram_config.webhook_port,
+                url_path=telegram_config.token,
+                webhook_url=f"{telegram_config.webhook_url.rstrip('/')}/{telegram_config.token}",
+                secret_token=telegram_config.webhook_secret,
+            )
+        else:
+            application.run_polling(timeout=telegram_config.polling_timeout)
         
     except Exception as e:
-        logger.error(f"Failed to start bot: {e}")
+        logger.error("Failed to start bot: %s", e)
         print(f"❌ Error starting bot: {e}")
 
 